@@ -5,92 +5,95 @@
 #   python3 prepare_courses_for_ios.py
 
 import json
+import sys
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
+from typing import Optional
+
+try:
+    import orjson  # optional: much faster JSON writer for the big output file
+except ImportError:
+    orjson = None
+
+try:
+    import ijson  # optional: stream courses.json instead of loading it all at once
+except ImportError:
+    ijson = None
 
 # ----- CONFIG -----
 TERM = "202509"   # change to the term you want, e.g. 202501(spring 2025), 202509(Fall 2025), 202609(Spring 2026), etc.
+WORKERS = 1       # >1 converts schools in that many worker processes (only used when there are more than 4 schools)
 
 DATA_ROOT = Path("quacs-data") / "semester_data" / TERM
 
 catalog_path = DATA_ROOT / "catalog.json"
 courses_path = DATA_ROOT / "courses.json"
 
-print(f"Using catalog: {catalog_path}")
-print(f"Using courses: {courses_path}")
-
-# ----- LOAD SOURCE FILES -----
-
-with catalog_path.open() as f:
-    catalog = json.load(f)
+# ----- HELPERS -----
 
-with courses_path.open() as f:
-    schools = json.load(f)
+def iter_schools(path: Path):
+    """Yield one school at a time from courses.json (a top-level list)."""
+    with path.open("rb") as f:
+        if ijson is not None:
+            yield from ijson.items(f, "item", use_float=True)
+        else:
+            yield from json.load(f)
 
-# ----- HELPERS -----
+# Every valid HHMM value, formatted once up front.
+MILITARY_TIMES = {t: f"{t // 100:02d}:{t % 100:02d}" for t in range(2400) if t % 100 < 60}
 
-def military_to_str(t: int) -> str:
+def military_to_str(t: Optional[int]) -> str:
     """930 -> '09:30', 1430 -> '14:30'"""
     if t is None or t < 0:
         return ""
-    h = t // 100
-    m = t % 100
-    return f"{h:02d}:{m:02d}"
-
-# ----- BUILD COURSE MAP -----
-
-courses_by_key = {}  # "CSCI-2300" -> {...}
-
-# Base info from catalog (nice titles + descriptions)
-for key, item in catalog.items():
-    subj = item.get("subj", "")
-    crse = item.get("crse", "")
-    courses_by_key[key] = {
-        "subject": subj,
-        "number": crse,
-        "title": item.get("name", f"{subj} {crse}").strip(),
-        "description": item.get("description", "").strip(),
-        "sections": [],
+    s = MILITARY_TIMES.get(t)
+    if s is None:
+        s = f"{t // 100:02d}:{t % 100:02d}"
+    return s
+
+def intern(value):
+    """sys.intern for strings; anything else (SIS course numbers are ints) passes through."""
+    return sys.intern(value) if isinstance(value, str) else value
+
+def build_meeting(ts: dict) -> Optional[dict]:
+    """One SIS timeslot -> meeting dict, or None if it has no days or times."""
+    # Check the cheap fields first so skipped timeslots do no string work.
+    days = ts.get("days")
+    if not days:
+        return None
+    start = military_to_str(ts.get("timeStart", -1))
+    if not start:
+        return None
+    end = military_to_str(ts.get("timeEnd", -1))
+    if not end:
+        return None
+
+    # Day codes and rooms repeat across thousands of meetings; intern them so each
+    # distinct value is stored once.
+    return {
+        "days": [intern(d) for d in days],  # e.g. ["M", "R"]
+        "start": start,    # "09:30"
+        "end": end,        # "10:50"
+        "location": intern(ts.get("location", "").strip()),
     }
 
-# Merge in SIS course/section/timeslot info
-for school in schools:
+def convert_school(school: dict) -> list:
+    """One SIS school -> [(key, subj, crse, name, sections), ...] in source order."""
+    converted = []
     for course in school.get("courses", []):
-        subj = course.get("subj", "")
-        crse = course.get("crse", "")
+        subj = intern(course.get("subj", ""))
+        crse = intern(course.get("crse", ""))
         # some entries don't have name → fall back gracefully
         name = (course.get("name") or f"{subj} {crse}").strip()
         key = f"{subj}-{crse}"
 
-        if key not in courses_by_key:
-            courses_by_key[key] = {
-                "subject": subj,
-                "number": crse,
-                "title": name,
-                "description": "",
-                "sections": [],
-            }
-
+        # Meetings and sections stay plain dict literals: CPython builds them faster than
+        # namedtuples, and both JSON writers take them as-is with no conversion pass.
+        sections = []
         for section in course.get("sections", []):
-            meetings = []
-            for ts in section.get("timeslots", []):
-                days = ts.get("days") or []
-                start = military_to_str(ts.get("timeStart", -1))
-                end = military_to_str(ts.get("timeEnd", -1))
-                location = ts.get("location", "").strip()
-
-                if not days or not start or not end:
-                    continue
-
-                meetings.append(
-                    {
-                        "days": days,      # e.g. ["M", "R"]
-                        "start": start,    # "09:30"
-                        "end": end,        # "10:50"
-                        "location": location,
-                    }
-                )
+            meetings = [m for m in map(build_meeting, section.get("timeslots", [])) if m is not None]
 
-            courses_by_key[key]["sections"].append(
+            sections.append(
                 {
                     "crn": section.get("crn"),
                     "section": section.get("section", "").strip(),
@@ -99,13 +102,76 @@ for school in schools:
                 }
             )
 
-output = {
-    "term": TERM,
-    "courses": list(courses_by_key.values()),
-}
+        converted.append((key, subj, crse, name, sections))
+    return converted
+
+def main() -> None:
+    print(f"Using catalog: {catalog_path}")
+    print(f"Using courses: {courses_path}")
+
+    # ----- LOAD SOURCE FILES -----
+
+    with catalog_path.open() as f:
+        catalog = json.load(f)
+
+    # courses.json is read lazily by iter_schools() during the merge below.
+
+    # ----- BUILD COURSE MAP -----
+
+    # "CSCI-2300" -> {...}, with base info from catalog (nice titles + descriptions)
+    courses_by_key = {
+        key: {
+            "subject": item.get("subj", ""),
+            "number": item.get("crse", ""),
+            "title": (item["name"] if "name" in item else f"{item.get('subj', '')} {item.get('crse', '')}").strip(),
+            "description": item.get("description", "").strip(),
+            "sections": [],
+        }
+        for key, item in catalog.items()
+    }
+
+    # Merge in SIS course/section/timeslot info. Schools are independent, so with
+    # WORKERS > 1 they are converted in parallel and merged here in source order.
+    schools = iter_schools(courses_path)
+    pool = None
+    if WORKERS > 1:
+        schools = list(schools)
+        if len(schools) > 4:
+            pool = ProcessPoolExecutor(max_workers=WORKERS)
+    try:
+        converted = pool.map(convert_school, schools) if pool else map(convert_school, schools)
+        for school_courses in converted:
+            for key, subj, crse, name, sections in school_courses:
+                entry = courses_by_key.get(key)
+                if entry is None:
+                    entry = courses_by_key[key] = {
+                        "subject": subj,
+                        "number": crse,
+                        "title": name,
+                        "description": "",
+                        "sections": [],
+                    }
+                entry["sections"].extend(sections)
+    finally:
+        if pool:
+            pool.shutdown()
+
+    output = {
+        "term": TERM,
+        "courses": list(courses_by_key.values()),
+    }
+
+    # Encode the whole file up front and hand it to the OS in one write, rather than
+    # json.dump()'s stream of small chunks.
+    if orjson is not None:
+        payload = orjson.dumps(output, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(output, indent=2).encode("utf-8")
+
+    out_path = Path(f"rpi_courses_{TERM}.json")
+    out_path.write_bytes(payload)
 
-out_path = Path(f"rpi_courses_{TERM}.json")
-with out_path.open("w") as f:
-    json.dump(output, f, indent=2)
+    print(f"Wrote {out_path.resolve()}")
 
-print(f"Wrote {out_path.resolve()}")
\ No newline at end of file
+if __name__ == "__main__":
+    main()
@@ -15,20 +15,28 @@ Usage:
   python3 Tools/scrapers/rpi_academic_calendar_scraper.py --academic-year 25 --debug --out Data/Academic_calendar_25.json
 
 If --out is omitted, it defaults to <repo_root>/Data/Academic_calendar_<yy>.json
+Pass --gzip to write a compressed <out>.gz instead of the plain JSON file.
 """
 
 from __future__ import annotations
 
 import argparse
+import functools
+import gzip
 import json
 import re
 from dataclasses import dataclass, asdict
-from datetime import datetime, date
+from datetime import datetime, date, timezone
 from pathlib import Path
 from typing import Optional, Tuple, List, Dict
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+
+try:
+    import orjson  # optional: much faster JSON writer
+except ImportError:
+    orjson = None
 
 
 SOURCE_URL = "https://registrar.rpi.edu/academic-calendar"
@@ -48,8 +56,12 @@ MONTHS = {
     "Dec": 12, "December": 12,
 }
 
+WS_RE = re.compile(r"\s+")
+DAY_ONLY_RE = re.compile(r"\d{1,2}")
+DOW_RE = re.compile(r"[A-Za-z]{3}")
+
 
-@dataclass
+@dataclass(frozen=True)
 class Tags:
     noClasses: bool = False
     holiday: bool = False
@@ -69,24 +81,6 @@ class Tags:
         }
 
 
-@dataclass
-class Event:
-    title: str
-    startDate: str
-    endDate: str
-    dow: Optional[str]
-    tags: Tags
-
-    def to_json(self) -> Dict:
-        return {
-            "title": self.title,
-            "startDate": self.startDate,
-            "endDate": self.endDate,
-            "dow": self.dow,
-            "tags": self.tags.to_json(),
-        }
-
-
 def repo_root_from_this_file() -> Path:
     # .../Tools/scrapers/rpi_academic_calendar_scraper.py -> repo root is 2 levels up
     return Path(__file__).resolve().parents[2]
@@ -107,9 +101,15 @@ def month_to_year(month_num: int, fall_year: int, spring_year: int) -> int:
 
 
 def normalize_ws(s: str) -> str:
-    return re.sub(r"\s+", " ", s).strip()
+    return WS_RE.sub(" ", s).strip()
+
+
+def cell_text(el: lxml.html.HtmlElement) -> str:
+    # All text under el, space-joined so adjacent inline tags don't run together.
+    return normalize_ws(" ".join(el.itertext()))
 
 
+@functools.lru_cache(maxsize=64)
 def parse_month_name_to_num(s: str) -> Optional[int]:
     s = s.strip()
     if not s:
@@ -122,10 +122,9 @@ def parse_month_name_to_num(s: str) -> Optional[int]:
     return MONTHS.get(s.title())
 
 
-DATE_SINGLE_RE = re.compile(r"^(?P<mon>[A-Za-z]{3,9})\s+(?P<day>\d{1,2})$")
-DATE_RANGE_SAME_MON_RE = re.compile(r"^(?P<mon>[A-Za-z]{3,9})\s+(?P<d1>\d{1,2})\s*-\s*(?P<d2>\d{1,2})$")
-DATE_RANGE_CROSS_MON_RE = re.compile(
-    r"^(?P<m1>[A-Za-z]{3,9})\s+(?P<d1>\d{1,2})\s*-\s*(?P<m2>[A-Za-z]{3,9})\s+(?P<d2>\d{1,2})$"
+# Matches "Sep 1", "Sep 25 - 26", "Sep 25 - Sep 26" and "Dec 23 - Jan 9" in one pass.
+DATE_CELL_RE = re.compile(
+    r"^(?P<m1>[A-Za-z]{3,9})\s+(?P<d1>\d{1,2})(?:\s*-\s*(?:(?P<m2>[A-Za-z]{3,9})\s+)?(?P<d2>\d{1,2}))?$"
 )
 
 
@@ -133,32 +132,48 @@ def to_iso(d: date) -> str:
     return d.isoformat()
 
 
+TAG_KEYWORD_RE = re.compile(
+    r"(?P<no_classes>no classes)"
+    r"|(?P<holiday>holiday)"
+    r"|(?P<follow>follow a(?= ))"
+    r"|(?P<schedule> class schedule)"
+    r"|(?P<finals>final exams)"
+    r"|(?P<reading>reading/study|reading day|study day)"
+    r"|(?P<brk>break)",
+    re.IGNORECASE,
+)
+
+
+@functools.lru_cache(maxsize=512)
 def infer_tags(title: str) -> Tags:
-    t = title.lower()
-    tags = Tags()
+    # Titles like "Final Exams" recur across terms, so results are cached; Tags is frozen
+    # because the same instance is shared between events.
+    # One case-insensitive scan finds every keyword; "follow a" uses a lookahead so the
+    # space it shares with " class schedule" (as in "follow a class schedule") isn't consumed.
+    found = {m.lastgroup for m in TAG_KEYWORD_RE.finditer(title)}
 
-    # no classes
-    if "no classes" in t:
-        tags.noClasses = True
+    # no classes ("break-no classes" is covered by this too)
+    no_classes = "no_classes" in found
 
-    # holiday heuristic
-    if "staff holiday" in t or "holiday" in t:
-        tags.holiday = True
+    # holiday heuristic (also covers "staff holiday")
+    holiday = "holiday" in found
 
     # follow-day
-    if "follow a " in t and " class schedule" in t:
-        tags.followDay = True
+    follow_day = "follow" in found and "schedule" in found
 
     # finals / reading / breaks
-    if "final exams" in t:
-        tags.finals = True
-    if "reading/study" in t or "reading day" in t or "study day" in t:
-        tags.readingDays = True
-    if "break-no classes" in t or ("break" in t and "no classes" in t):
-        tags.break_ = True
-        tags.noClasses = True
+    finals = "finals" in found
+    reading_days = "reading" in found
+    break_ = "brk" in found and no_classes
 
-    return tags
+    return Tags(
+        noClasses=no_classes,
+        holiday=holiday,
+        followDay=follow_day,
+        finals=finals,
+        readingDays=reading_days,
+        break_=break_,
+    )
 
 
 def parse_date_cell(date_cell: str, current_month_num: Optional[int], fall_year: int, spring_year: int) -> Tuple[date, date, Optional[int]]:
@@ -172,41 +187,30 @@ def parse_date_cell(date_cell: str, current_month_num: Optional[int], fall_year:
     """
     s = normalize_ws(date_cell)
 
-    # Some rows may show like "Sep 25 - Sep 26" with month repeated or not.
-    m = DATE_RANGE_CROSS_MON_RE.match(s)
+    m = DATE_CELL_RE.match(s)
     if m:
         m1 = parse_month_name_to_num(m.group("m1"))
-        m2 = parse_month_name_to_num(m.group("m2"))
         d1 = int(m.group("d1"))
-        d2 = int(m.group("d2"))
-        if not m1 or not m2:
-            raise ValueError(f"Unrecognized month in date range: {s}")
-
+        if not m1:
+            raise ValueError(f"Unrecognized month in date: {s}")
         y1 = month_to_year(m1, fall_year, spring_year)
-        y2 = month_to_year(m2, fall_year, spring_year)
-        return date(y1, m1, d1), date(y2, m2, d2), m2
 
-    m = DATE_RANGE_SAME_MON_RE.match(s)
-    if m:
-        mon = parse_month_name_to_num(m.group("mon"))
-        d1 = int(m.group("d1"))
+        if m.group("d2") is None:
+            return date(y1, m1, d1), date(y1, m1, d1), m1
+
         d2 = int(m.group("d2"))
-        if not mon:
-            raise ValueError(f"Unrecognized month in date range: {s}")
-        y = month_to_year(mon, fall_year, spring_year)
-        return date(y, mon, d1), date(y, mon, d2), mon
+        # Some rows may show like "Sep 25 - Sep 26" with month repeated or not.
+        if m.group("m2") is None:
+            return date(y1, m1, d1), date(y1, m1, d2), m1
 
-    m = DATE_SINGLE_RE.match(s)
-    if m:
-        mon = parse_month_name_to_num(m.group("mon"))
-        d1 = int(m.group("day"))
-        if not mon:
-            raise ValueError(f"Unrecognized month in date: {s}")
-        y = month_to_year(mon, fall_year, spring_year)
-        return date(y, mon, d1), date(y, mon, d1), mon
+        m2 = parse_month_name_to_num(m.group("m2"))
+        if not m2:
+            raise ValueError(f"Unrecognized month in date range: {s}")
+        y2 = month_to_year(m2, fall_year, spring_year)
+        return date(y1, m1, d1), date(y2, m2, d2), m2
 
     # Fallback: if the cell is just a day number (rare), use current_month_num
-    if re.fullmatch(r"\d{1,2}", s) and current_month_num is not None:
+    if DAY_ONLY_RE.fullmatch(s) and current_month_num is not None:
         d1 = int(s)
         y = month_to_year(current_month_num, fall_year, spring_year)
         return date(y, current_month_num, d1), date(y, current_month_num, d1), current_month_num
@@ -214,41 +218,50 @@ def parse_date_cell(date_cell: str, current_month_num: Optional[int], fall_year:
     raise ValueError(f"Could not parse date cell: {date_cell!r}")
 
 
-def scrape(yy: int, debug: bool = False) -> Dict:
+def scrape(yy: int, debug: bool = False, session: Optional[requests.Session] = None) -> Dict:
+    """
+    Pass a shared requests.Session when scraping several years so the
+    connection to the registrar is reused instead of re-negotiated per call.
+    """
     fall_year, spring_year = academic_year_to_years(yy)
+    generated_at = datetime.now(timezone.utc).isoformat(timespec="seconds")
 
-    resp = requests.get(SOURCE_URL, params={"academic_year": f"{yy:02d}"}, timeout=30)
+    http = session if session is not None else requests
+    resp = http.get(SOURCE_URL, params={"academic_year": f"{yy:02d}"}, timeout=30)
     resp.raise_for_status()
 
-    soup = BeautifulSoup(resp.text, "html.parser")
+    # Parse and walk the page with lxml directly; both happen in C rather than in
+    # BeautifulSoup's Python-level tree.
+    doc = lxml.html.fromstring(resp.text)
 
     # Find the academic calendar tables. The page is Drupal and often has multiple tables.
     # We pick tables that have headers containing Date/Day/Event.
+    # Header text is only substring-tested, so it doesn't need whitespace normalization.
     tables = []
-    for tbl in soup.find_all("table"):
-        th_text = " ".join(normalize_ws(th.get_text(" ", strip=True)) for th in tbl.find_all("th"))
+    for tbl in doc.iter("table"):
+        th_text = " ".join(" ".join(th.itertext()) for th in tbl.iter("th"))
         if "Date" in th_text and "Day" in th_text and "Event" in th_text:
             tables.append(tbl)
 
     if not tables:
         # Debug dump if needed
         if debug:
-            print("DEBUG: No matching tables found. HTML title:", soup.title.get_text(strip=True) if soup.title else "N/A")
+            print("DEBUG: No matching tables found. HTML title:", doc.findtext(".//title", "N/A").strip())
         return {
             "source": SOURCE_URL,
             "academicYear": str(fall_year),
-            "generatedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "+00:00",
+            "generatedAt": generated_at,
             "terms": {"fall": {"classesBegin": None, "classesEnd": None}, "spring": {"classesBegin": None, "classesEnd": None}},
             "events": [],
         }
 
-    events: List[Event] = []
+    events: List[Dict] = []
     current_month_num: Optional[int] = None
 
     for tbl in tables:
         # each row should be Date | Day | Event (but ranges often have blank Day)
-        for tr in tbl.find_all("tr"):
-            tds = tr.find_all("td")
+        for tr in tbl.iter("tr"):
+            tds = list(tr.iter("td"))
             if len(tds) < 2:
                 continue
 
@@ -256,9 +269,9 @@ def scrape(yy: int, debug: bool = False) -> Dict:
             if len(tds) < 3:
                 continue
 
-            date_txt = normalize_ws(tds[0].get_text(" ", strip=True))
-            day_txt = normalize_ws(tds[1].get_text(" ", strip=True)) or None
-            event_txt = normalize_ws(tds[2].get_text(" ", strip=True))
+            date_txt = cell_text(tds[0])
+            day_txt = cell_text(tds[1]) or None
+            event_txt = cell_text(tds[2])
 
             # Skip empties / header-ish rows
             if not date_txt or not event_txt:
@@ -276,74 +289,57 @@ def scrape(yy: int, debug: bool = False) -> Dict:
             if day_txt:
                 # Day sometimes contains things like "Fri" or is blank for ranges
                 # Keep as 3-letter if it looks like that; else null
-                if not re.fullmatch(r"[A-Za-z]{3}", day_txt):
+                if not DOW_RE.fullmatch(day_txt):
                     day_txt = None
                 else:
                     day_txt = day_txt.title()
 
-            ev = Event(
-                title=event_txt,
-                startDate=to_iso(start_d),
-                endDate=to_iso(end_d),
-                dow=day_txt,
-                tags=infer_tags(event_txt),
-            )
-            events.append(ev)
-
-    # Term inference from event titles
-    def find_first_date_containing(substr: str) -> Optional[str]:
-        s = substr.lower()
-        for ev in events:
-            if s in ev.title.lower():
-                return ev.startDate
-        return None
-
-    def find_last_date_containing(substr: str) -> Optional[str]:
-        s = substr.lower()
-        for ev in reversed(events):
-            if s in ev.title.lower():
-                return ev.startDate
-        return None
-
-    # Fall classes begin often includes "Fall 20XX Classes Begin"
-    fall_begin = find_first_date_containing("fall") if find_first_date_containing("classes begin") else None
-    # Better: specifically match "Fall" and "Classes Begin"
-    for ev in events:
-        t = ev.title.lower()
-        if "fall" in t and "classes begin" in t:
-            fall_begin = ev.startDate
-            break
-
-    fall_end = None
+            # Events are built directly in their output JSON shape.
+            events.append({
+                "title": event_txt,
+                "startDate": to_iso(start_d),
+                "endDate": to_iso(end_d),
+                "dow": day_txt,
+                "tags": infer_tags(event_txt).to_json(),
+            })
+
+    # Term inference from event titles, in a single pass over the events.
+    # Each term boundary is the first event whose title matches.
+    fall_begin = fall_end = spring_begin = spring_end = None
+    first_fall = None
+    any_classes_begin = False
     for ev in events:
-        t = ev.title.lower()
-        if "last day of fall" in t and "classes" in t:
-            fall_end = ev.startDate
-            break
-
-    spring_begin = None
-    for ev in events:
-        t = ev.title.lower()
-        if "spring" in t and "classes begin" in t:
-            spring_begin = ev.startDate
-            break
-
-    spring_end = None
-    for ev in events:
-        t = ev.title.lower()
-        if "last day of spring" in t and "classes" in t:
-            spring_end = ev.startDate
-            break
+        t = ev["title"].lower()
+        is_classes_begin = "classes begin" in t
+        any_classes_begin = any_classes_begin or is_classes_begin
+
+        if "fall" in t:
+            if first_fall is None:
+                first_fall = ev["startDate"]
+            # Fall classes begin often includes "Fall 20XX Classes Begin"
+            if fall_begin is None and is_classes_begin:
+                fall_begin = ev["startDate"]
+        if fall_end is None and "last day of fall" in t and "classes" in t:
+            fall_end = ev["startDate"]
+        if spring_begin is None and "spring" in t and is_classes_begin:
+            spring_begin = ev["startDate"]
+        if spring_end is None and "last day of spring" in t and "classes" in t:
+            spring_end = ev["startDate"]
+
+    # Fallback when no title has both "Fall" and "Classes Begin": first "fall" event,
+    # as long as some event mentions classes beginning at all.
+    if fall_begin is None and any_classes_begin:
+        fall_begin = first_fall
 
     out = {
         "source": SOURCE_URL,
         "academicYear": str(fall_year),
-        "generatedAt": datetime.utcnow().replace(microsecond=0).isoformat() + "+00:00",
+        "generatedAt": generated_at,
         "terms": {
             "fall": {"classesBegin": fall_begin, "classesEnd": fall_end},
             "spring": {"classesBegin": spring_begin, "classesEnd": spring_end},
         },
-        "events": [ev.to_json() for ev in events],
+        "events": events,
     }
 
     return out
@@ -353,6 +349,7 @@ def main() -> None:
     ap = argparse.ArgumentParser()
     ap.add_argument("--academic-year", type=int, required=True, help="Two-digit academic year, e.g. 25 for 2025-2026")
     ap.add_argument("--out", type=str, default=None, help="Output JSON path. Default: <repo_root>/Data/Academic_calendar_<yy>.json")
+    ap.add_argument("--gzip", action="store_true", help="Write gzip-compressed output to <out>.gz instead of plain JSON")
     ap.add_argument("--debug", action="store_true", help="Print debug info")
     args = ap.parse_args()
 
@@ -360,10 +357,21 @@ def main() -> None:
     default_out = repo_root / "Data" / f"Academic_calendar_{args.academic_year:02d}.json"
     out_path = Path(args.out).expanduser().resolve() if args.out else default_out
 
-    data = scrape(args.academic_year, debug=args.debug)
+    with requests.Session() as session:
+        data = scrape(args.academic_year, debug=args.debug, session=session)
+
+    if orjson is not None:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
 
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    out_path.write_text(json.dumps(data, indent=2), encoding="utf-8")
+    if args.gzip:
+        out_path = out_path.with_name(out_path.name + ".gz")
+        with gzip.open(out_path, "wb") as f:
+            f.write(payload)
+    else:
+        out_path.write_bytes(payload)
 
     if args.debug:
         print(f"DEBUG: wrote {out_path}")